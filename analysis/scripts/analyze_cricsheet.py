@@ -23,11 +23,13 @@ Cricsheet data format: JSON files with nested ball-by-ball structure
 import json
 import os
 import argparse
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import accumulate
 import csv
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing
@@ -437,6 +439,9 @@ class CricsheetLoader:
 
             # Process results as they complete
             for i, future in enumerate(as_completed(futures)):
+                # Drop our reference so each file's parsed dicts can be freed once
+                # converted, rather than all of them living until the pool closes
+                del futures[future]
                 try:
                     match_info_dict, delivery_dicts = future.result()
                     if match_info_dict and delivery_dicts:
@@ -719,6 +724,35 @@ class CricsheetLoader:
 class TournamentAnalyzer:
     """Analyzes cricket data by tournament and format."""
 
+    # Delivery fields copied into the DataFrame: only those the pandas
+    # analyses read, since the rest stay available on the deliveries
+    DATAFRAME_COLUMNS = (
+        'tournament',
+        'format',
+        'over',
+        'runs_batter',
+        'runs_total',
+        'wicket_kind',
+        'is_valid_ball',
+    )
+
+    # Per-ball counts are small, so store them in compact integer columns, and
+    # repeated labels as categoricals so filters compare integer codes
+    DATAFRAME_DTYPES = {
+        'tournament': 'category',
+        'format': 'category',
+        'wicket_kind': 'category',
+        'over': 'int16',
+        'runs_batter': 'int8',
+        'runs_total': 'int8',
+    }
+
+    # Columns kept when selecting valid balls for analysis
+    VALID_COLUMNS = [
+        'over', 'runs_batter', 'runs_total', 'wicket_kind',
+        'is_wicket', 'is_boundary', 'is_dot',
+    ]
+
     def __init__(self, deliveries: List[Delivery]):
         self.deliveries = deliveries
 
@@ -726,36 +760,38 @@ class TournamentAnalyzer:
             self._build_dataframe()
 
     def _build_dataframe(self):
-        """Convert deliveries to pandas DataFrame."""
-        records = []
-        for d in self.deliveries:
-            records.append({
-                'match_id': d.match_id,
-                'tournament': d.tournament,
-                'format': d.format,
-                'season': d.season,
-                'date': d.date,
-                'venue': d.venue,
-                'innings': d.innings,
-                'over': d.over,
-                'ball': d.ball,
-                'batting_team': d.batting_team,
-                'bowling_team': d.bowling_team,
-                'batter': d.batter,
-                'bowler': d.bowler,
-                'runs_batter': d.runs_batter,
-                'runs_extras': d.runs_extras,
-                'runs_total': d.runs_total,
-                'extra_type': d.extra_type,
-                'wicket_kind': d.wicket_kind,
-                'wicket_player': d.wicket_player,
-                'is_valid_ball': d.is_valid_ball,
-                'batter_balls_so_far': d.batter_balls_so_far,
-                'team_runs_so_far': d.team_runs_so_far,
-                'team_wickets_so_far': d.team_wickets_so_far,
-                'partnership_runs': d.partnership_runs,
-            })
-        self.df = pd.DataFrame(records)
+        """Convert deliveries to a column-oriented pandas DataFrame."""
+        columns = {
+            name: [getattr(d, name) for d in self.deliveries]
+            for name in self.DATAFRAME_COLUMNS
+        }
+        self.df = pd.DataFrame(columns).astype(self.DATAFRAME_DTYPES)
+
+        # Outcome flags shared by every analysis, computed once up front
+        is_wicket = self.df['wicket_kind'].notna()
+        self.df['is_wicket'] = is_wicket
+        self.df['is_boundary'] = ~is_wicket & self.df['runs_batter'].isin([4, 6])
+        self.df['is_dot'] = ~is_wicket & (self.df['runs_batter'] == 0)
+
+        self._valid_cache: Dict[Tuple[Optional[str], Optional[str]], 'pd.DataFrame'] = {}
+
+    def _select_valid(self, tournament: Optional[str],
+                      format_type: Optional[str]) -> 'pd.DataFrame':
+        """
+        Get the valid balls for a tournament/format, with the analysis columns.
+
+        All filters are combined into one mask and only VALID_COLUMNS are
+        copied. The result is cached per filter, so callers must not modify it.
+        """
+        key = (tournament, format_type)
+        if key not in self._valid_cache:
+            mask = self.df['is_valid_ball']
+            if tournament:
+                mask = mask & (self.df['tournament'] == tournament)
+            if format_type:
+                mask = mask & (self.df['format'] == format_type)
+            self._valid_cache[key] = self.df.loc[mask, self.VALID_COLUMNS]
+        return self._valid_cache[key]
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics across all loaded data."""
@@ -800,29 +836,26 @@ class TournamentAnalyzer:
     def _compute_base_outcomes_pandas(self, tournament: Optional[str] = None,
                                        format_type: Optional[str] = None) -> Dict[str, float]:
         """Pandas version of outcome computation."""
-        df = self.df.copy()
-
-        if tournament:
-            df = df[df['tournament'] == tournament]
-        if format_type:
-            df = df[df['format'] == format_type]
-
-        valid = df[df['is_valid_ball'] == True]
+        valid = self._select_valid(tournament, format_type)
         total = len(valid)
 
         if total == 0:
             return {}
 
-        wickets = valid['wicket_kind'].notna().sum()
-        non_wicket = valid[valid['wicket_kind'].isna()]
+        wickets = valid['is_wicket'].sum()
+
+        # Count every runs value off non-wicket balls in a single pass
+        runs_counts = np.bincount(
+            valid.loc[~valid['is_wicket'], 'runs_batter'].to_numpy(), minlength=7
+        )
 
         outcomes = {
-            'dot': (non_wicket['runs_batter'] == 0).sum() / total,
-            'single': (non_wicket['runs_batter'] == 1).sum() / total,
-            'two': (non_wicket['runs_batter'] == 2).sum() / total,
-            'three': (non_wicket['runs_batter'] == 3).sum() / total,
-            'four': (non_wicket['runs_batter'] == 4).sum() / total,
-            'six': (non_wicket['runs_batter'] == 6).sum() / total,
+            'dot': runs_counts[0] / total,
+            'single': runs_counts[1] / total,
+            'two': runs_counts[2] / total,
+            'three': runs_counts[3] / total,
+            'four': runs_counts[4] / total,
+            'six': runs_counts[6] / total,
             'wicket': wickets / total,
         }
 
@@ -869,73 +902,49 @@ class TournamentAnalyzer:
         if not PANDAS_AVAILABLE:
             return self._compute_phase_stats_python(tournament, format_type)
 
-        df = self.df.copy()
-
-        if tournament:
-            df = df[df['tournament'] == tournament]
-        if format_type:
-            df = df[df['format'] == format_type]
-
-        valid = df[df['is_valid_ball'] == True].copy()
+        valid = self._select_valid(tournament, format_type)
 
-        # Define phases based on format
+        # Define phases based on format (last over of each phase but the final one)
         if format_type == 't20':
-            def get_phase(over):
-                if over <= 6:
-                    return 'powerplay'
-                elif over <= 15:
-                    return 'middle'
-                else:
-                    return 'death'
+            phase_ends, phase_names = [6, 15], ['powerplay', 'middle', 'death']
         elif format_type == 'odi':
-            def get_phase(over):
-                if over <= 10:
-                    return 'powerplay'
-                elif over <= 40:
-                    return 'middle'
-                else:
-                    return 'death'
+            phase_ends, phase_names = [10, 40], ['powerplay', 'middle', 'death']
         else:  # Test
-            def get_phase(over):
-                if over <= 30:
-                    return 'new_ball'
-                elif over <= 80:
-                    return 'middle'
-                else:
-                    return 'old_ball'
+            phase_ends, phase_names = [30, 80], ['new_ball', 'middle', 'old_ball']
 
-        valid['phase'] = valid['over'].apply(get_phase)
-
-        phase_stats = {}
-        base_outcomes = self.compute_base_outcomes(tournament, format_type)
-        base_boundary = base_outcomes.get('four', 0.1) + base_outcomes.get('six', 0.05)
-
-        for phase in valid['phase'].unique():
-            phase_df = valid[valid['phase'] == phase]
-            total = len(phase_df)
+        valid = valid.assign(
+            phase=pd.cut(valid['over'], bins=[-np.inf, *phase_ends, np.inf], labels=phase_names)
+        )
 
-            if total < 100:
-                continue
+        # One pass over the columns for all phases, in order of first appearance
+        phase_totals = valid.groupby('phase', observed=True, sort=False).agg(
+            balls=('is_wicket', 'size'),
+            wickets=('is_wicket', 'sum'),
+            boundaries=('is_boundary', 'sum'),
+            dots=('is_dot', 'sum'),
+            runs=('runs_total', 'sum'),
+        )
 
-            wickets = phase_df['wicket_kind'].notna().sum()
-            non_wicket = phase_df[phase_df['wicket_kind'].isna()]
-            boundaries = ((non_wicket['runs_batter'] == 4) | (non_wicket['runs_batter'] == 6)).sum()
-            dots = (non_wicket['runs_batter'] == 0).sum()
+        phase_totals = phase_totals[phase_totals['balls'] >= 100]
 
-            runs = phase_df['runs_total'].sum()
-            overs = total / 6
+        base_outcomes = self.compute_base_outcomes(tournament, format_type)
+        base_boundary = base_outcomes.get('four', 0.1) + base_outcomes.get('six', 0.05)
 
-            phase_stats[phase] = {
-                'balls': total,
-                'boundary_rate': boundaries / total,
-                'wicket_rate': wickets / total,
-                'dot_rate': dots / total,
-                'run_rate': runs / overs if overs > 0 else 0,
-                'boundary_mod': (boundaries / total) / base_boundary if base_boundary > 0 else 1.0,
-                'wicket_mod': (wickets / total) / base_outcomes.get('wicket', 0.05),
-            }
+        # Derive every rate for all phases at once from the per-phase totals
+        balls = phase_totals['balls']
+        phase_stats = pd.DataFrame({
+            'balls': balls,
+            'boundary_rate': phase_totals['boundaries'] / balls,
+            'wicket_rate': phase_totals['wickets'] / balls,
+            'dot_rate': phase_totals['dots'] / balls,
+            'run_rate': phase_totals['runs'] / (balls / 6),
+        })
+        phase_stats['boundary_mod'] = (
+            phase_stats['boundary_rate'] / base_boundary if base_boundary > 0 else 1.0
+        )
+        phase_stats['wicket_mod'] = phase_stats['wicket_rate'] / base_outcomes.get('wicket', 0.05)
 
-        return phase_stats
+        return phase_stats.to_dict('index')
 
     def _compute_phase_stats_python(self, tournament: Optional[str] = None,
                                      format_type: Optional[str] = None) -> Dict[str, Dict[str, float]]:
@@ -1002,19 +1011,19 @@ class TournamentAnalyzer:
     def compute_dismissal_types(self, tournament: Optional[str] = None,
                                  format_type: Optional[str] = None) -> Dict[str, float]:
         """Compute dismissal type distribution."""
-        filtered = [d for d in self.deliveries
-                    if d.wicket_kind
-                    and (not tournament or d.tournament == tournament)
-                    and (not format_type or d.format == format_type)]
+        raw_counts = Counter(d.wicket_kind for d in self.deliveries
+                             if d.wicket_kind
+                             and (not tournament or d.tournament == tournament)
+                             and (not format_type or d.format == format_type))
 
-        total = len(filtered)
+        total = sum(raw_counts.values())
         if total == 0:
             return {}
 
+        # Normalize each distinct kind once rather than once per wicket
         counts = defaultdict(int)
-        for d in filtered:
-            kind = d.wicket_kind.lower().replace(' ', '_')
-            counts[kind] += 1
+        for raw_kind, count in raw_counts.items():
+            counts[raw_kind.lower().replace(' ', '_')] += count
 
         return {k: v / total for k, v in sorted(counts.items(), key=lambda x: -x[1])}
 
@@ -1274,11 +1283,9 @@ class PlayerProfileBuilder:
 def print_report(loader: CricsheetLoader, analyzer: TournamentAnalyzer,
                  profile_builder: PlayerProfileBuilder, output_file: Optional[str] = None):
     """Print comprehensive analysis report."""
+    # Collected and written in one go rather than printed line by line
     lines = []
-
-    def log(text: str = ""):
-        print(text)
-        lines.append(text)
+    log = lines.append
 
     log("=" * 70)
     log("CRICSHEET DATA ANALYSIS REPORT")
@@ -1384,11 +1391,14 @@ def print_report(loader: CricsheetLoader, analyzer: TournamentAnalyzer,
             for phase, stats in ipl_phase.items():
                 log(f"  {phase}: RR={stats['run_rate']:.2f}, Boundary={stats['boundary_rate']:.4f}, Wicket={stats['wicket_rate']:.4f}")
 
+    report = '\n'.join(lines)
+    print(report)
+
     # Save report if output file specified
     if output_file:
         with open(output_file, 'w') as f:
-            f.write('\n'.join(lines))
-        log(f"\nReport saved to: {output_file}")
+            f.write(report)
+        print(f"\nReport saved to: {output_file}")
 
 
 def export_probability_params(analyzer: TournamentAnalyzer, output_dir: str):
@@ -1438,14 +1448,51 @@ class AdvancedAnalyzer:
 
     def __init__(self, deliveries: List[Delivery]):
         self.deliveries = deliveries
+        self._valid_cache: Dict[Tuple[Optional[str], Optional[str]], List[Delivery]] = {}
+        self._innings_cache: Dict[Tuple[Optional[str], Optional[str]], List[List[Delivery]]] = {}
+
+    def _valid_balls(self, tournament: Optional[str],
+                     format_type: Optional[str]) -> List[Delivery]:
+        """
+        Get the valid balls for a tournament/format.
+
+        Filtered once per filter and shared by the analyses. The result is
+        cached, so callers must not modify it.
+        """
+        key = (tournament, format_type)
+        if key not in self._valid_cache:
+            self._valid_cache[key] = [
+                d for d in self.deliveries
+                if d.is_valid_ball
+                and (not tournament or d.tournament == tournament)
+                and (not format_type or d.format == format_type)
+            ]
+        return self._valid_cache[key]
+
+    def _innings_balls(self, tournament: Optional[str],
+                       format_type: Optional[str]) -> List[List[Delivery]]:
+        """
+        Get the valid balls for a tournament/format grouped by innings, in ball order.
+
+        Grouped and sorted once per filter and shared by the per-innings
+        analyses. The result is cached, so callers must not modify it.
+        """
+        key = (tournament, format_type)
+        if key not in self._innings_cache:
+            match_innings = defaultdict(list)
+            for d in self._valid_balls(tournament, format_type):
+                match_innings[(d.match_id, d.innings)].append(d)
+
+            for balls in match_innings.values():
+                balls.sort(key=lambda x: (x.over, x.ball))
+
+            self._innings_cache[key] = list(match_innings.values())
+        return self._innings_cache[key]
 
     def compute_partnership_dynamics(self, tournament: Optional[str] = None,
                                       format_type: Optional[str] = None) -> Dict[str, Dict[str, float]]:
         """Analyze how batting changes as partnership builds."""
-        filtered = [d for d in self.deliveries
-                    if d.is_valid_ball
-                    and (not tournament or d.tournament == tournament)
-                    and (not format_type or d.format == format_type)]
+        filtered = self._valid_balls(tournament, format_type)
 
         if not filtered:
             return {}
@@ -1465,19 +1512,40 @@ class AdvancedAnalyzer:
             (100, 500, "100+"),
         ]
 
+        # Tally every bracket in one pass, locating each ball's bracket by bisection
+        bracket_lows = [low for low, _, _ in brackets]
+        bracket_data = defaultdict(lambda: {
+            'balls': 0, 'wickets': 0, 'boundaries': 0, 'dots': 0, 'runs': 0
+        })
+
+        for d in filtered:
+            i = bisect_right(bracket_lows, d.partnership_runs) - 1
+            if i < 0 or d.partnership_runs >= brackets[i][1]:
+                continue
+
+            data = bracket_data[i]
+            data['balls'] += 1
+            data['runs'] += d.runs_batter
+            if d.wicket_kind:
+                data['wickets'] += 1
+            elif d.runs_batter == 0:
+                data['dots'] += 1
+            if d.runs_batter in [4, 6]:
+                data['boundaries'] += 1
+
         partnership_stats = {}
 
-        for low, high, label in brackets:
-            subset = [d for d in filtered if low <= d.partnership_runs < high]
-            total_subset = len(subset)
+        for i, (low, high, label) in enumerate(brackets):
+            data = bracket_data[i]
+            total_subset = data['balls']
 
             if total_subset < 500:
                 continue
 
-            wickets = sum(1 for d in subset if d.wicket_kind)
-            boundaries = sum(1 for d in subset if d.runs_batter in [4, 6])
-            dots = sum(1 for d in subset if d.runs_batter == 0 and not d.wicket_kind)
-            runs = sum(d.runs_batter for d in subset)
+            wickets = data['wickets']
+            boundaries = data['boundaries']
+            dots = data['dots']
+            runs = data['runs']
 
             partnership_stats[label] = {
                 'balls': total_subset,
@@ -1494,10 +1562,7 @@ class AdvancedAnalyzer:
     def compute_momentum_analysis(self, tournament: Optional[str] = None,
                                    format_type: Optional[str] = None) -> Dict[str, Any]:
         """Analyze momentum patterns (scoring bursts, pressure)."""
-        filtered = [d for d in self.deliveries
-                    if d.is_valid_ball
-                    and (not tournament or d.tournament == tournament)
-                    and (not format_type or d.format == format_type)]
+        filtered = self._valid_balls(tournament, format_type)
 
         if not filtered:
             return {}
@@ -1506,104 +1571,66 @@ class AdvancedAnalyzer:
         base_boundary = sum(1 for d in filtered if d.runs_batter in [4, 6]) / total
         base_wicket = sum(1 for d in filtered if d.wicket_kind) / total
 
-        # Group by match and innings to calculate rolling stats
-        match_innings = defaultdict(list)
-        for d in filtered:
-            key = (d.match_id, d.innings)
-            match_innings[key].append(d)
-
-        # Calculate recent stats for each delivery
-        deliveries_with_recent = []
+        # Tally each ball's outcome under its recent-boundary count (capped at
+        # 3+) and recent-dot count (capped at 5+), in one pass
+        tallies = {
+            'by_recent_boundaries': defaultdict(lambda: {'balls': 0, 'wickets': 0, 'boundaries': 0}),
+            'by_recent_dots': defaultdict(lambda: {'balls': 0, 'wickets': 0, 'boundaries': 0}),
+        }
+        by_boundaries = tallies['by_recent_boundaries']
+        by_dots = tallies['by_recent_dots']
 
-        for key, balls in match_innings.items():
-            balls.sort(key=lambda x: (x.over, x.ball))
+        for balls in self._innings_balls(tournament, format_type):
+            # Running totals before each ball; a window is then one subtraction
+            boundaries_before = [0, *accumulate(int(b.runs_batter in [4, 6]) for b in balls)]
+            dots_before = [0, *accumulate(int(b.runs_batter == 0) for b in balls)]
 
             for i, d in enumerate(balls):
-                recent_6 = balls[max(0, i-6):i]
-
-                recent_runs = sum(b.runs_batter for b in recent_6)
-                recent_boundaries = sum(1 for b in recent_6 if b.runs_batter in [4, 6])
-                recent_dots = sum(1 for b in recent_6 if b.runs_batter == 0)
+                start = max(0, i-6)
+                recent_boundaries = min(boundaries_before[i] - boundaries_before[start], 3)
+                recent_dots = min(dots_before[i] - dots_before[start], 5)
 
-                deliveries_with_recent.append({
-                    'delivery': d,
-                    'recent_runs': recent_runs,
-                    'recent_boundaries': recent_boundaries,
-                    'recent_dots': recent_dots,
-                })
+                is_wicket = 1 if d.wicket_kind else 0
+                is_boundary = 1 if d.runs_batter in [4, 6] else 0
+                for tally in (by_boundaries[recent_boundaries], by_dots[recent_dots]):
+                    tally['balls'] += 1
+                    tally['wickets'] += is_wicket
+                    tally['boundaries'] += is_boundary
 
-        # Analyze by recent boundaries
         momentum_stats = {'by_recent_boundaries': {}, 'by_recent_dots': {}}
 
-        for count in [0, 1, 2, 3]:
-            if count == 3:
-                subset = [x for x in deliveries_with_recent if x['recent_boundaries'] >= 3]
-                label = "3+"
-            else:
-                subset = [x for x in deliveries_with_recent if x['recent_boundaries'] == count]
-                label = str(count)
-
-            total_subset = len(subset)
-            if total_subset < 1000:
-                continue
-
-            wickets = sum(1 for x in subset if x['delivery'].wicket_kind)
-            boundaries = sum(1 for x in subset if x['delivery'].runs_batter in [4, 6])
-
-            momentum_stats['by_recent_boundaries'][label] = {
-                'balls': total_subset,
-                'boundary_mod': (boundaries / total_subset) / base_boundary if base_boundary > 0 else 1.0,
-                'wicket_mod': (wickets / total_subset) / base_wicket if base_wicket > 0 else 1.0,
-            }
-
-        # Analyze by recent dots (pressure)
-        for count in [0, 1, 2, 3, 4, 5]:
-            if count == 5:
-                subset = [x for x in deliveries_with_recent if x['recent_dots'] >= 5]
-                label = "5+"
-            else:
-                subset = [x for x in deliveries_with_recent if x['recent_dots'] == count]
-                label = str(count)
-
-            total_subset = len(subset)
-            if total_subset < 1000:
-                continue
-
-            wickets = sum(1 for x in subset if x['delivery'].wicket_kind)
-            boundaries = sum(1 for x in subset if x['delivery'].runs_batter in [4, 6])
-
-            momentum_stats['by_recent_dots'][label] = {
-                'balls': total_subset,
-                'boundary_mod': (boundaries / total_subset) / base_boundary if base_boundary > 0 else 1.0,
-                'wicket_mod': (wickets / total_subset) / base_wicket if base_wicket > 0 else 1.0,
-            }
+        for stats_key, cap in [('by_recent_boundaries', 3), ('by_recent_dots', 5)]:
+            for count in range(cap + 1):
+                tally = tallies[stats_key][count]
+                total_subset = tally['balls']
+                if total_subset < 1000:
+                    continue
+
+                label = f"{count}+" if count == cap else str(count)
+                wickets = tally['wickets']
+                boundaries = tally['boundaries']
+
+                momentum_stats[stats_key][label] = {
+                    'balls': total_subset,
+                    'boundary_mod': (boundaries / total_subset) / base_boundary if base_boundary > 0 else 1.0,
+                    'wicket_mod': (wickets / total_subset) / base_wicket if base_wicket > 0 else 1.0,
+                }
 
         return momentum_stats
 
     def compute_wicket_clustering(self, tournament: Optional[str] = None,
                                    format_type: Optional[str] = None) -> Dict[str, Any]:
         """Analyze wicket clustering (collapse patterns)."""
-        filtered = [d for d in self.deliveries
-                    if d.is_valid_ball
-                    and (not tournament or d.tournament == tournament)
-                    and (not format_type or d.format == format_type)]
+        match_innings = self._innings_balls(tournament, format_type)
 
-        if not filtered:
+        if not match_innings:
             return {}
 
-        # Group by match and innings
-        match_innings = defaultdict(list)
-        for d in filtered:
-            key = (d.match_id, d.innings)
-            match_innings[key].append(d)
-
         gaps = []
         collapse_count = 0
         total_innings = len(match_innings)
 
-        for key, balls in match_innings.items():
-            balls.sort(key=lambda x: (x.over, x.ball))
-
+        for balls in match_innings:
             # Find wicket positions
             wicket_positions = [i for i, b in enumerate(balls) if b.wicket_kind]
 
@@ -1611,15 +1638,11 @@ class AdvancedAnalyzer:
                 continue
 
             # Calculate gaps between wickets
-            for i in range(1, len(wicket_positions)):
-                gap = wicket_positions[i] - wicket_positions[i-1]
-                gaps.append(gap)
+            gaps.extend(b - a for a, b in zip(wicket_positions, wicket_positions[1:]))
 
             # Check for collapse (3+ wickets in 18 balls)
-            for i in range(len(wicket_positions) - 2):
-                if wicket_positions[i+2] - wicket_positions[i] <= 18:
-                    collapse_count += 1
-                    break
+            if any(c - a <= 18 for a, c in zip(wicket_positions, wicket_positions[2:])):
+                collapse_count += 1
 
         if not gaps:
             return {}
@@ -1632,9 +1655,9 @@ class AdvancedAnalyzer:
             'mean_gap': mean_gap,
             'median_gap': median_gap,
             'collapse_rate': collapse_count / total_innings if total_innings > 0 else 0,
-            'within_6_balls': sum(1 for g in gaps if g <= 6) / len(gaps),
-            'within_12_balls': sum(1 for g in gaps if g <= 12) / len(gaps),
-            'within_18_balls': sum(1 for g in gaps if g <= 18) / len(gaps),
+            'within_6_balls': bisect_right(gaps_sorted, 6) / len(gaps),
+            'within_12_balls': bisect_right(gaps_sorted, 12) / len(gaps),
+            'within_18_balls': bisect_right(gaps_sorted, 18) / len(gaps),
             'sample_size': len(gaps),
         }
 
@@ -1642,9 +1665,14 @@ class AdvancedAnalyzer:
         """Compare statistics across formats."""
         comparison = {}
 
+        # Group valid balls by format in one pass
+        by_format = defaultdict(list)
+        for d in self.deliveries:
+            if d.is_valid_ball:
+                by_format[d.format].append(d)
+
         for format_type in ['t20', 'odi', 'test']:
-            filtered = [d for d in self.deliveries
-                        if d.is_valid_ball and d.format == format_type]
+            filtered = by_format.get(format_type)
 
             if not filtered:
                 continue
@@ -1680,11 +1708,13 @@ class AdvancedAnalyzer:
         # Get all tournaments of the specified format
         tournaments = set(d.tournament for d in self.deliveries if d.format == format_type)
 
-        for tournament in tournaments:
-            filtered = [d for d in self.deliveries
-                        if d.is_valid_ball
-                        and d.tournament == tournament]
+        # Group their valid balls by tournament in one pass
+        by_tournament = defaultdict(list)
+        for d in self.deliveries:
+            if d.is_valid_ball and d.tournament in tournaments:
+                by_tournament[d.tournament].append(d)
 
+        for tournament, filtered in by_tournament.items():
             if len(filtered) < 1000:  # Need minimum sample
                 continue
 
@@ -1709,6 +1739,44 @@ class AdvancedAnalyzer:
         return dict(sorted(comparison.items(), key=lambda x: -x[1]['matches']))
 
 
+# Analyzer shared with forked workers by run_advanced_analyses
+_shared_advanced: Optional[AdvancedAnalyzer] = None
+
+
+def _run_advanced_analysis(method_name: str, kwargs: Dict[str, Any]) -> Any:
+    """Run one AdvancedAnalyzer method in a forked worker process."""
+    return getattr(_shared_advanced, method_name)(**kwargs)
+
+
+def run_advanced_analyses(advanced: AdvancedAnalyzer, tasks: Dict[str, Tuple[str, Dict[str, Any]]],
+                          parallel: bool = False, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run independent AdvancedAnalyzer methods, in parallel worker processes if requested.
+
+    tasks maps a result name to (method name, keyword arguments). Workers are
+    forked so they inherit the deliveries instead of pickling them, so where
+    fork is unavailable the tasks run sequentially.
+    """
+    global _shared_advanced
+
+    if not parallel or 'fork' not in multiprocessing.get_all_start_methods():
+        return {name: getattr(advanced, method)(**kwargs)
+                for name, (method, kwargs) in tasks.items()}
+
+    if workers is None:
+        workers = min(multiprocessing.cpu_count(), 8)
+
+    _shared_advanced = advanced
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = {name: executor.submit(_run_advanced_analysis, method, kwargs)
+                       for name, (method, kwargs) in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+    finally:
+        _shared_advanced = None
+
+
 def export_player_database(profile_builder: PlayerProfileBuilder, output_file: str,
                             min_balls: int = 100):
     """Export player database to CSV."""
@@ -1825,67 +1893,81 @@ def main():
     # Advanced analysis
     print("\nRunning advanced analysis...")
     advanced = AdvancedAnalyzer(loader.deliveries)
+    results = run_advanced_analyses(advanced, {
+        'formats': ('compare_formats', {}),
+        't20_leagues': ('compare_tournaments', {'format_type': 't20'}),
+        'clustering_t20': ('compute_wicket_clustering', {'format_type': 't20'}),
+        'clustering_odi': ('compute_wicket_clustering', {'format_type': 'odi'}),
+        'clustering_test': ('compute_wicket_clustering', {'format_type': 'test'}),
+        'partnership': ('compute_partnership_dynamics', {'format_type': 't20'}),
+        'momentum': ('compute_momentum_analysis', {'format_type': 't20'}),
+    }, parallel=args.parallel, workers=args.workers)
+
+    # Collect the advanced sections and print them in one write
+    lines = []
 
     # Format comparison
-    format_comparison = advanced.compare_formats()
+    format_comparison = results['formats']
     if format_comparison:
-        print("\n" + "=" * 50)
-        print("FORMAT COMPARISON")
-        print("=" * 50)
-        print(f"\n{'Format':10s} {'Matches':>8s} {'RPO':>6s} {'Bound%':>7s} {'6s%':>6s} {'Wkt%':>6s} {'Dot%':>6s}")
-        print("-" * 55)
+        lines.append("\n" + "=" * 50)
+        lines.append("FORMAT COMPARISON")
+        lines.append("=" * 50)
+        lines.append(f"\n{'Format':10s} {'Matches':>8s} {'RPO':>6s} {'Bound%':>7s} {'6s%':>6s} {'Wkt%':>6s} {'Dot%':>6s}")
+        lines.append("-" * 55)
         for fmt, stats in format_comparison.items():
-            print(f"{fmt.upper():10s} {stats['matches']:8d} {stats['runs_per_over']:6.2f} "
-                  f"{stats['boundary_rate']*100:7.2f} {stats['six_rate']*100:6.2f} "
-                  f"{stats['wicket_rate']*100:6.2f} {stats['dot_rate']*100:6.2f}")
+            lines.append(f"{fmt.upper():10s} {stats['matches']:8d} {stats['runs_per_over']:6.2f} "
+                         f"{stats['boundary_rate']*100:7.2f} {stats['six_rate']*100:6.2f} "
+                         f"{stats['wicket_rate']*100:6.2f} {stats['dot_rate']*100:6.2f}")
 
     # T20 tournament comparison
-    t20_comparison = advanced.compare_tournaments('t20')
+    t20_comparison = results['t20_leagues']
     if t20_comparison:
-        print("\n" + "=" * 50)
-        print("T20 LEAGUE COMPARISON")
-        print("=" * 50)
-        print(f"\n{'League':25s} {'Matches':>8s} {'RPO':>6s} {'Bound%':>7s} {'6s%':>6s}")
-        print("-" * 55)
+        lines.append("\n" + "=" * 50)
+        lines.append("T20 LEAGUE COMPARISON")
+        lines.append("=" * 50)
+        lines.append(f"\n{'League':25s} {'Matches':>8s} {'RPO':>6s} {'Bound%':>7s} {'6s%':>6s}")
+        lines.append("-" * 55)
         for tournament, stats in list(t20_comparison.items())[:10]:
-            print(f"{stats['display_name'][:25]:25s} {stats['matches']:8d} "
-                  f"{stats['runs_per_over']:6.2f} {stats['boundary_rate']*100:7.2f} "
-                  f"{stats['six_rate']*100:6.2f}")
+            lines.append(f"{stats['display_name'][:25]:25s} {stats['matches']:8d} "
+                         f"{stats['runs_per_over']:6.2f} {stats['boundary_rate']*100:7.2f} "
+                         f"{stats['six_rate']*100:6.2f}")
 
     # Wicket clustering analysis
-    print("\n" + "=" * 50)
-    print("WICKET CLUSTERING BY FORMAT")
-    print("=" * 50)
+    lines.append("\n" + "=" * 50)
+    lines.append("WICKET CLUSTERING BY FORMAT")
+    lines.append("=" * 50)
     for fmt in ['t20', 'odi', 'test']:
-        clustering = advanced.compute_wicket_clustering(format_type=fmt)
+        clustering = results[f'clustering_{fmt}']
         if clustering:
-            print(f"\n{fmt.upper()}:")
-            print(f"  Mean gap between wickets: {clustering['mean_gap']:.1f} balls")
-            print(f"  Collapse rate (3+ in 3 overs): {clustering['collapse_rate']*100:.1f}%")
-            print(f"  Wickets within 6 balls: {clustering['within_6_balls']*100:.1f}%")
+            lines.append(f"\n{fmt.upper()}:")
+            lines.append(f"  Mean gap between wickets: {clustering['mean_gap']:.1f} balls")
+            lines.append(f"  Collapse rate (3+ in 3 overs): {clustering['collapse_rate']*100:.1f}%")
+            lines.append(f"  Wickets within 6 balls: {clustering['within_6_balls']*100:.1f}%")
 
     # Partnership dynamics (T20)
-    partnership = advanced.compute_partnership_dynamics(format_type='t20')
+    partnership = results['partnership']
     if partnership:
-        print("\n" + "=" * 50)
-        print("PARTNERSHIP DYNAMICS (T20)")
-        print("=" * 50)
-        print(f"\n{'Runs':10s} {'Balls':>8s} {'SR':>7s} {'Bound Mod':>10s} {'Wkt Mod':>10s}")
-        print("-" * 50)
+        lines.append("\n" + "=" * 50)
+        lines.append("PARTNERSHIP DYNAMICS (T20)")
+        lines.append("=" * 50)
+        lines.append(f"\n{'Runs':10s} {'Balls':>8s} {'SR':>7s} {'Bound Mod':>10s} {'Wkt Mod':>10s}")
+        lines.append("-" * 50)
         for bracket, stats in partnership.items():
-            print(f"{bracket:10s} {stats['balls']:8d} {stats['strike_rate']:7.1f} "
-                  f"{stats['boundary_mod']:10.3f} {stats['wicket_mod']:10.3f}")
+            lines.append(f"{bracket:10s} {stats['balls']:8d} {stats['strike_rate']:7.1f} "
+                         f"{stats['boundary_mod']:10.3f} {stats['wicket_mod']:10.3f}")
 
     # Momentum analysis (T20)
-    momentum = advanced.compute_momentum_analysis(format_type='t20')
+    momentum = results['momentum']
     if momentum and 'by_recent_boundaries' in momentum:
-        print("\n" + "=" * 50)
-        print("MOMENTUM ANALYSIS (T20)")
-        print("=" * 50)
-        print("\nBoundaries in last over → next ball:")
+        lines.append("\n" + "=" * 50)
+        lines.append("MOMENTUM ANALYSIS (T20)")
+        lines.append("=" * 50)
+        lines.append("\nBoundaries in last over → next ball:")
         for count, stats in momentum['by_recent_boundaries'].items():
-            print(f"  {count} boundaries: boundary_mod={stats['boundary_mod']:.3f}, "
-                  f"wicket_mod={stats['wicket_mod']:.3f}")
+            lines.append(f"  {count} boundaries: boundary_mod={stats['boundary_mod']:.3f}, "
+                         f"wicket_mod={stats['wicket_mod']:.3f}")
+
+    print("\n".join(lines))
 
     # Export probability parameters
     if args.export_params:
@@ -82,18 +82,24 @@ def load_ipl_data() -> pd.DataFrame:
         deliveries = extract_ipl_deliveries(filepath)
         all_deliveries.extend(deliveries)
 
-    df = pd.DataFrame(all_deliveries)
+    # Only three phase labels, so group on category codes rather than strings
+    df = pd.DataFrame(all_deliveries, columns=["phase", "is_wicket"]).astype({"phase": "category"})
     print(f"Loaded {len(df):,} IPL deliveries")
     return df
 
 
 def calculate_phase_stats(df: pd.DataFrame) -> Dict:
+    # One grouped pass instead of re-filtering the frame per phase
+    by_phase = df.groupby("phase", observed=True, sort=False)["is_wicket"]
+    wicket_rates = by_phase.mean() * 100
+    deliveries = by_phase.size()
+
     stats = {}
     for phase in ["powerplay", "middle", "death"]:
-        phase_data = df[df["phase"] == phase]
-        wicket_rate = phase_data["is_wicket"].mean() * 100
-        deliveries = len(phase_data)
-        stats[phase] = {"wicket_rate": wicket_rate, "deliveries": deliveries}
+        stats[phase] = {
+            "wicket_rate": wicket_rates.get(phase, float("nan")),
+            "deliveries": int(deliveries.get(phase, 0)),
+        }
     return stats
 
 
@@ -93,13 +93,16 @@ def load_data() -> pd.DataFrame:
         deliveries = extract_deliveries(filepath)
         all_deliveries.extend(deliveries)
 
-    df = pd.DataFrame(all_deliveries)
+    # A handful of league labels, so group on category codes rather than strings
+    df = pd.DataFrame(
+        all_deliveries, columns=["tournament", "total_runs", "is_six", "is_four"]
+    ).astype({"tournament": "category"})
     print(f"Loaded {len(df):,} T20 league deliveries")
     return df
 
 
 def calculate_stats(df: pd.DataFrame) -> pd.DataFrame:
-    stats = df.groupby("tournament").agg({
+    stats = df.groupby("tournament", observed=True, sort=False).agg({
         "total_runs": ["count", "mean"],
         "is_six": "mean",
         "is_four": "mean",
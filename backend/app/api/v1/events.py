@@ -17,7 +17,7 @@ router = APIRouter()
 
 
 @router.post("/generate", response_model=GenerateEventResponse)
-async def generate_event(
+def generate_event(
     request: GenerateEventRequest,
     force_trigger: bool = Query(False, description="Skip random trigger chance")
 ):
@@ -51,15 +51,13 @@ async def generate_event(
         force_trigger=force_trigger,
     )
 
-    # Build debug info
-    loader = get_event_loader()
-    template_counts = loader.get_template_count()
-
+    # Build debug info (the engine holds the loader singleton)
+    loader = engine.loader
     return GenerateEventResponse(
         event=event,
         debug={
-            "template_counts": template_counts,
-            "total_templates": sum(template_counts.values()),
+            "template_counts": loader.get_template_count(),
+            "total_templates": loader.get_template_total(),
             "event_triggered": event is not None,
             "force_trigger": force_trigger,
             "category_filter": category_filter,
@@ -68,7 +66,7 @@ async def generate_event(
 
 
 @router.post("/resolve", response_model=ResolveEventResponse)
-async def resolve_event(request: ResolveEventRequest):
+def resolve_event(request: ResolveEventRequest):
     """
     Resolve an event with a chosen option.
 
@@ -117,18 +115,17 @@ async def resolve_event(request: ResolveEventRequest):
 
 
 @router.get("/templates/count")
-async def get_template_counts():
+def get_template_counts():
     """Get count of event templates by category."""
     loader = get_event_loader()
-    counts = loader.get_template_count()
     return {
-        "counts": counts,
-        "total": sum(counts.values()),
+        "counts": loader.get_template_count(),
+        "total": loader.get_template_total(),
     }
 
 
 @router.get("/templates/{template_id}")
-async def get_template(template_id: str):
+def get_template(template_id: str):
     """Get a specific event template by ID (for debugging)."""
     loader = get_event_loader()
     template = loader.get_template(template_id)
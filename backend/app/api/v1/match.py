@@ -1,6 +1,8 @@
 """Match simulation API endpoints."""
 
-from typing import Dict, List, Optional
+import heapq
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
 
@@ -14,40 +16,29 @@ from app.schemas.match import (
     BowlerAlternative,
     ContextUpdates,
     UpdatedState,
-    RunsOutcome,
-    WicketOutcome,
-    ExtraOutcome,
-    BatterStats,
 )
-from app.schemas.player import PlayerStats
-from app.schemas.common import MatchPhase, MatchFormat, get_format_config
-from app.engine.match_engine import MatchEngine
-from app.engine.probability_model import get_probability_model
+from app.schemas.player import (
+    PlayerStats,
+    BowlerStats,
+    EMPTY_BATTER_STATS,
+    EMPTY_BOWLER_STATS,
+)
+from app.schemas.common import (
+    MatchPhase,
+    MatchFormat,
+    PlayerRole,
+)
+from app.engine.match_engine import MatchEngine, get_engine
+from app.services.simulation_pool import run_simulate_over
 
 router = APIRouter()
 
-# Cache engines per format
-_engines: Dict[str, MatchEngine] = {}
-
-
-def get_engine(format_name: str = "t20") -> MatchEngine:
-    """Get or create match engine instance for the specified format."""
-    global _engines
-    format_key = format_name.lower()
-
-    if format_key not in _engines:
-        format_config = get_format_config(format_key)
-        probability_model = get_probability_model(format_key)
-        _engines[format_key] = MatchEngine(
-            probability_model=probability_model,
-            format_config=format_config,
-        )
-
-    return _engines[format_key]
+# Roles considered for automatic next-bowler recommendations
+_BOWLING_ROLES = frozenset({PlayerRole.BOWLER, PlayerRole.ALLROUNDER})
 
 
 @router.post("/simulate/ball", response_model=SimulateBallResponse)
-async def simulate_ball(request: SimulateBallRequest):
+def simulate_ball(request: SimulateBallRequest):
     """
     Simulate a single ball delivery.
 
@@ -75,44 +66,44 @@ async def simulate_ball(request: SimulateBallRequest):
         new_wickets = request.innings_state.wickets
         new_balls = request.innings_state.balls
         new_overs = request.innings_state.overs
-        current_batters = list(request.innings_state.current_batters)
-        striker_changed = False
+        current_batters = request.innings_state.current_batters
+        striker_idx = 0  # Index of the new striker in current_batters
         new_batsman_needed = False
-        innings_complete = False
 
-        if isinstance(outcome, WicketOutcome):
+        # Dispatch on the union's discriminator tag rather than isinstance
+        kind = outcome.type
+        if kind == "wicket":
             new_runs += outcome.runs
             new_wickets += 1
             new_balls += 1
-            new_batsman_needed = new_wickets < 10
-            innings_complete = new_wickets >= 10
-        elif isinstance(outcome, ExtraOutcome):
+            new_batsman_needed = new_wickets < engine.MAX_WICKETS
+        elif kind == "extra":
             new_runs += outcome.runs
             if outcome.extra_type not in ("wide", "noball"):
                 new_balls += 1
-        elif isinstance(outcome, RunsOutcome):
+        elif kind == "runs":
             new_runs += outcome.runs
             new_balls += 1
             if outcome.runs % 2 == 1:
-                current_batters = [current_batters[1], current_batters[0]]
-                striker_changed = True
+                striker_idx ^= 1
 
         # Check over completion
         if new_balls >= 6:
             new_overs += 1
             new_balls = 0
-            current_batters = [current_batters[1], current_batters[0]]
-            striker_changed = not striker_changed
+            striker_idx ^= 1
 
-        # Check innings completion (use format-specific overs)
-        if new_overs >= engine.TOTAL_OVERS:
-            innings_complete = True
-        if request.target and new_runs >= request.target:
-            innings_complete = True
+        # Check innings completion (use format-specific limits)
+        innings_complete = (
+            new_wickets >= engine.MAX_WICKETS
+            or new_overs >= engine.TOTAL_OVERS
+            or bool(request.target and new_runs >= request.target)
+        )
 
         # Get context updates
-        batter_stats = request.innings_state.batter_stats.get(
-            request.striker.id, BatterStats()
+        batter_stats = (
+            request.innings_state.batter_stats.get(request.striker.id)
+            or EMPTY_BATTER_STATS
         )
         batsman_state = engine.get_batsman_state(batter_stats.balls + 1)
         pressure_level = engine.get_pressure_level(request.innings_state, request.target)
@@ -126,8 +117,11 @@ async def simulate_ball(request: SimulateBallRequest):
                 wickets=new_wickets,
                 overs=new_overs,
                 balls=new_balls,
-                current_batters=tuple(current_batters),
-                striker_changed=striker_changed,
+                current_batters=(
+                    current_batters[striker_idx],
+                    current_batters[striker_idx ^ 1],
+                ),
+                striker_changed=striker_idx == 1,
                 innings_complete=innings_complete,
                 new_batsman_needed=new_batsman_needed,
             ),
@@ -144,7 +138,7 @@ async def simulate_ball(request: SimulateBallRequest):
 
 
 @router.post("/simulate/over", response_model=SimulateOverResponse)
-async def simulate_over(request: SimulateOverRequest):
+def simulate_over(request: SimulateOverRequest):
     """
     Simulate a complete over.
 
@@ -163,7 +157,8 @@ async def simulate_over(request: SimulateOverRequest):
         raise HTTPException(status_code=400, detail=f"Bowler {request.bowler_id} not found")
 
     try:
-        over_summary, updated_state, innings_complete = engine.simulate_over(
+        over_summary, updated_state, innings_complete, narratives = run_simulate_over(
+            request.match_format,
             batting_team=request.batting_team,
             bowling_team=request.bowling_team,
             bowler=bowler,
@@ -176,13 +171,12 @@ async def simulate_over(request: SimulateOverRequest):
 
         # Get recommended next bowler
         recommended_bowler = _recommend_next_bowler(
+            engine=engine,
             bowling_team=request.bowling_team,
             updated_state=updated_state,
             last_bowler_id=bowler.id,
         )
 
-        narratives = [ball.narrative for ball in over_summary.balls]
-
         return SimulateOverResponse(
             over_summary=over_summary,
             updated_innings_state=updated_state,
@@ -196,7 +190,7 @@ async def simulate_over(request: SimulateOverRequest):
 
 
 @router.post("/bowler/recommend", response_model=BowlerRecommendResponse)
-async def recommend_bowler(request: BowlerRecommendRequest):
+def recommend_bowler(request: BowlerRecommendRequest):
     """
     Get smart bowler recommendation based on match context.
 
@@ -205,82 +199,85 @@ async def recommend_bowler(request: BowlerRecommendRequest):
     engine = get_engine()
     phase = engine.get_phase(request.innings_state.overs)
 
-    # Filter eligible bowlers
-    eligible = []
-    for bowler in request.available_bowlers:
-        if bowler.id == request.last_bowler_id:
-            continue
-        bowler_stats = request.innings_state.bowler_stats.get(bowler.id)
-        overs_bowled = bowler_stats.overs if bowler_stats else 0
-        if overs_bowled < 4:  # Max 4 overs per bowler
-            eligible.append(bowler)
+    # Filter eligible bowlers (max 4 overs per bowler)
+    bowler_stats = request.innings_state.bowler_stats
+    eligible = [
+        b for b in request.available_bowlers
+        if b.id != request.last_bowler_id
+        and ((s := bowler_stats.get(b.id)) is None or s.overs < 4)
+    ]
 
     if not eligible:
         # Fallback: anyone who hasn't maxed out
         eligible = [
             b for b in request.available_bowlers
-            if (request.innings_state.bowler_stats.get(b.id) or type('', (), {'overs': 0})()).overs < 4
+            if (bowler_stats.get(b.id) or EMPTY_BOWLER_STATS).overs < 4
         ]
 
     if not eligible:
         raise HTTPException(status_code=400, detail="No eligible bowlers available")
 
-    # Score each bowler
+    # Score each bowler (numbers only - reasoning is built for the top 4 below)
+    phase_bonuses = engine.spell_phase_bonuses[phase]
     analyses = []
     for bowler in eligible:
-        score, reasoning = _score_bowler(bowler, request.innings_state, phase, request.match_context)
-        analyses.append((bowler, score, reasoning))
+        # Look the stats up once and share them with the reasoning step
+        stats = bowler_stats.get(bowler.id)
+        analyses.append((bowler, _simple_bowler_score(bowler, stats, phase_bonuses), stats))
 
-    # Sort by score descending
-    analyses.sort(key=lambda x: x[1], reverse=True)
+    # Best bowler plus top 3 alternatives, by score descending
+    top = heapq.nlargest(4, analyses, key=itemgetter(1))
+    recent_wickets = _count_recent_wickets(request.innings_state)
 
-    best = analyses[0]
+    best = top[0]
     alternatives = [
         BowlerAlternative(
-            bowler_id=a[0].id,
-            score=a[1],
-            reasoning=a[2],
+            bowler_id=bowler.id,
+            score=score,
+            reasoning=_bowler_reasoning(
+                bowler, stats, recent_wickets, phase, request.match_context
+            ),
         )
-        for a in analyses[1:4]  # Top 3 alternatives
+        for bowler, score, stats in top[1:]
     ]
 
     return BowlerRecommendResponse(
         recommended_bowler_id=best[0].id,
-        reasoning=best[2],
+        reasoning=_bowler_reasoning(
+            best[0], best[2], recent_wickets, phase, request.match_context
+        ),
         alternatives=alternatives,
     )
 
 
 def _recommend_next_bowler(
+    engine: MatchEngine,
     bowling_team: List[PlayerStats],
     updated_state,
     last_bowler_id: str,
 ) -> Optional[str]:
     """Simple next bowler recommendation."""
-    engine = get_engine()
     phase = engine.get_phase(updated_state.overs)
 
     # Get eligible bowlers
-    eligible = []
-    for bowler in bowling_team:
-        if bowler.role.value not in ("bowler", "allrounder"):
-            continue
-        if bowler.id == last_bowler_id:
-            continue
-        bowler_stats = updated_state.bowler_stats.get(bowler.id)
-        overs_bowled = bowler_stats.overs if bowler_stats else 0
-        if overs_bowled < 4:
-            eligible.append(bowler)
+    bowler_stats = updated_state.bowler_stats
+    eligible = [
+        b for b in bowling_team
+        if b.role in _BOWLING_ROLES
+        and b.id != last_bowler_id
+        and ((s := bowler_stats.get(b.id)) is None or s.overs < 4)
+    ]
 
     if not eligible:
         return None
 
     # Simple scoring
+    phase_bonuses = engine.spell_phase_bonuses[phase]
     best_bowler = None
     best_score = -1
 
     for bowler in eligible:
-        score = _simple_bowler_score(bowler, updated_state, phase)
+        score = _simple_bowler_score(bowler, bowler_stats.get(bowler.id), phase_bonuses)
         if score > best_score:
             best_score = score
             best_bowler = bowler
@@ -288,46 +285,23 @@ def _recommend_next_bowler(
     return best_bowler.id if best_bowler else None
 
 
-def _simple_bowler_score(bowler: PlayerStats, state, phase: MatchPhase) -> float:
+def _simple_bowler_score(
+    bowler: PlayerStats,
+    bowler_stats: Optional[BowlerStats],
+    phase_bonuses: Tuple[float, float, float],
+) -> float:
     """
     Simple bowler scoring for recommendations.
 
-    Uses IPL-derived spell patterns:
-    - Pace: 49.5% PP, 27.4% middle, 23.1% death
-    - Spin: 22.8% PP, 65.9% middle, 11.3% death
+    phase_bonuses is the engine's spell-pattern bonus row for the current
+    phase, indexed by bowling style kind.
     """
     score = 50.0
-    engine = get_engine()
-
-    # Get spell patterns from config
-    spell_patterns = engine.probability_model.params.get("spell_patterns", {})
-    pace_profile = spell_patterns.get("pace_profile", {
-        "powerplay": 0.495, "middle": 0.274, "death": 0.231
-    })
-    spin_profile = spell_patterns.get("spin_profile", {
-        "powerplay": 0.228, "middle": 0.659, "death": 0.113
-    })
-
-    is_pace = bowler.bowling_style and "fast" in bowler.bowling_style.value.lower()
-    is_spin = bowler.bowling_style and "spin" in bowler.bowling_style.value.lower()
 
     # Phase matching using IPL-derived spell patterns
-    # Score bonus based on how much this bowler type typically bowls in this phase
-    phase_key = phase.value  # "powerplay", "middle", or "death"
-
-    if is_pace:
-        # Pace bowlers get bonus proportional to their typical phase usage
-        phase_weight = pace_profile.get(phase_key, 0.33)
-        # Scale: 0.495 (PP) -> +25, 0.274 (middle) -> +10, 0.231 (death) -> +15
-        score += phase_weight * 50  # Max ~25 points for preferred phase
-    elif is_spin:
-        # Spin bowlers get bonus proportional to their typical phase usage
-        phase_weight = spin_profile.get(phase_key, 0.33)
-        # Scale: 0.659 (middle) -> +33, 0.228 (PP) -> +11, 0.113 (death) -> +6
-        score += phase_weight * 50  # Max ~33 points for preferred phase
+    score += phase_bonuses[bowler.style_kind]
 
     # Wicket bonus
-    bowler_stats = state.bowler_stats.get(bowler.id)
     if bowler_stats:
         score += bowler_stats.wickets * 10
         # Economy
@@ -339,13 +313,7 @@ def _simple_bowler_score(bowler: PlayerStats, state, phase: MatchPhase) -> float
                 score -= 15
 
     # Skill bonus
-    overall_skill = (
-        bowler.bowling.speed * 0.2 +
-        bowler.bowling.accuracy * 0.35 +
-        bowler.bowling.variation * 0.25 +
-        bowler.bowling.stamina * 0.2
-    )
-    score += (overall_skill - 55) * 0.3
+    score += (bowler.bowling_skill - 55) * 0.3
 
     # Form bonus
     score += bowler.form * 0.5
@@ -353,41 +321,55 @@ def _simple_bowler_score(bowler: PlayerStats, state, phase: MatchPhase) -> float
     return score
 
 
-def _score_bowler(bowler: PlayerStats, state, phase: MatchPhase, context) -> tuple:
+def _count_recent_wickets(state) -> int:
+    """Count wickets in the last 3 overs."""
+    # A linear count: fall_of_wickets comes from the client, so its order isn't
+    # guaranteed, and it never holds more than ten entries
+    return sum(
+        1 for fow in state.fall_of_wickets
+        if fow.overs >= state.overs - 3
+    )
+
+
+def _bowler_reasoning(
+    bowler: PlayerStats,
+    bowler_stats: Optional[BowlerStats],
+    recent_wickets: int,
+    phase: MatchPhase,
+    context,
+) -> str:
     """
-    Score a bowler with detailed reasoning.
+    Explain a bowler choice for the recommendation response.
 
     Uses IPL-derived insights:
     - Pace bowls 50% in PP, 23% at death
     - Spin bowls 66% in middle overs
     - Partnership 30+ runs increases boundary rate by 19%
     """
-    score = _simple_bowler_score(bowler, state, phase)
-
     reasons = []
 
-    is_pace = bowler.bowling_style and "fast" in bowler.bowling_style.value.lower()
-    is_spin = bowler.bowling_style and "spin" in bowler.bowling_style.value.lower()
+    is_pace = bowler.is_pace
+    is_spin = bowler.is_spin
 
-    # Phase-based reasoning with IPL percentages
-    if phase == MatchPhase.POWERPLAY:
+    # Phase-based reasoning with IPL percentages (phase is always an enum
+    # member from get_phase, so identity checks suffice)
+    if phase is MatchPhase.POWERPLAY:
         if is_pace:
             reasons.append("Pace bowlers bowl 50% of PP overs in IPL")
         elif is_spin:
             reasons.append("Spin only 23% of PP overs - use strategically")
-    elif phase == MatchPhase.MIDDLE:
+    elif phase is MatchPhase.MIDDLE:
         if is_spin:
             reasons.append("Spin dominates middle overs (66% in IPL)")
         elif is_pace:
             reasons.append("Pace less common in middle (27%)")
-    elif phase == MatchPhase.DEATH:
+    elif phase is MatchPhase.DEATH:
         if is_pace:
             reasons.append("Pace handles death overs (23% allocation)")
         elif is_spin:
             reasons.append("Spin rare at death (11%) - risky choice")
 
     # Bowler on a roll
-    bowler_stats = state.bowler_stats.get(bowler.id)
     if bowler_stats and bowler_stats.wickets >= 2:
         reasons.append(f"On a roll with {bowler_stats.wickets} wickets")
 
@@ -401,13 +383,7 @@ def _score_bowler(bowler: PlayerStats, state, phase: MatchPhase, context) -> tup
         reasons.append(f"Partnership at {context.partnership_runs} - change of pace needed")
 
     # Recent wickets - pressure situation
-    recent_wickets = sum(
-        1 for fow in state.fall_of_wickets
-        if fow.overs >= state.overs - 3
-    )
     if recent_wickets >= 2:
         reasons.append(f"Keep pressure after {recent_wickets} recent wickets")
 
-    reasoning = "; ".join(reasons) if reasons else "Solid option for this phase"
-
-    return score, reasoning
+    return "; ".join(reasons) if reasons else "Solid option for this phase"
@@ -7,6 +7,10 @@ from typing import List
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+# Resolved once at import; Settings defaults reference these shared Paths
+BASE_DIR = Path(__file__).resolve().parent.parent
+CONFIG_DIR = BASE_DIR / "config"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -23,13 +27,15 @@ class Settings(BaseSettings):
     ]
 
     # Paths
-    base_dir: Path = Path(__file__).parent.parent
-    config_dir: Path = base_dir / "config"
-    probability_params_path: Path = config_dir / "probability_params.yaml"
-    event_templates_dir: Path = config_dir / "event_templates"
+    base_dir: Path = BASE_DIR
+    config_dir: Path = CONFIG_DIR
+    probability_params_path: Path = CONFIG_DIR / "probability_params.yaml"
+    event_templates_dir: Path = CONFIG_DIR / "event_templates"
 
     # Match engine
     event_trigger_chance: float = 0.35  # 35% chance to trigger event after match
+    simulation_workers: int = 0  # >0 runs over simulation in a process pool
+    threadpool_size: int = 0  # >0 overrides anyio's default of 40 sync-endpoint threads
 
     @field_validator("debug", mode="before")
     @classmethod
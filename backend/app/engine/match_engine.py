@@ -6,6 +6,9 @@ Supports multiple formats: T20, ODI, and Test cricket.
 """
 
 import random
+import threading
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Dict, List, Optional, Tuple
 
 from app.schemas.common import (
@@ -19,7 +22,13 @@ from app.schemas.common import (
     get_format_config,
     MATCH_FORMATS,
 )
-from app.schemas.player import PlayerStats, BatterStats, BowlerStats
+from app.schemas.player import (
+    PlayerStats,
+    BatterStats,
+    BowlerStats,
+    EMPTY_BATTER_STATS,
+    EMPTY_BOWLER_STATS,
+)
 from app.schemas.match import (
     BallOutcome,
     RunsOutcome,
@@ -35,9 +44,28 @@ from app.schemas.match import (
     ContextUpdates,
     UpdatedState,
 )
-from app.engine.probability_model import ProbabilityModel, SimulationContext
+from app.engine.probability_model import (
+    ProbabilityModel,
+    SimulationContext,
+    get_probability_model,
+)
 from app.engine.narrative_generator import NarrativeGenerator
 
+# Map format phase names to MatchPhase enum
+PHASE_MAPPING: Dict[str, MatchPhase] = {
+    "powerplay": MatchPhase.POWERPLAY,
+    "middle": MatchPhase.MIDDLE,
+    "death": MatchPhase.DEATH,
+    "new_ball": MatchPhase.POWERPLAY,  # Map Test phases to existing enums
+    "old_ball": MatchPhase.DEATH,
+}
+
+# Order in which rolled outcomes are laid out along the unit interval
+OUTCOME_ORDER: Tuple[str, ...] = ("dot", "single", "two", "three", "four", "six", "wicket")
+
+# Runs for outcomes that are always plain runs; fours and wickets need extra rolls
+PLAIN_RUNS_OUTCOMES: Dict[str, int] = {"dot": 0, "single": 1, "two": 2, "three": 3, "six": 6}
+
 
 class MatchEngine:
     """
@@ -65,19 +93,81 @@ class MatchEngine:
         self.probability_model = probability_model or ProbabilityModel()
         self.narrative_generator = NarrativeGenerator()
 
+        # Phase for each completed-over count. Phase boundaries are whole
+        # overs, so any overs value in [n, n+1) shares entry n.
+        self.phase_by_over: Tuple[MatchPhase, ...] = tuple(
+            self._classify_phase(over) for over in range(self.TOTAL_OVERS)
+        )
+
+        # Spell-pattern bonus per phase, indexed by bowling style kind
+        self.spell_phase_bonuses = self._build_spell_phase_bonuses()
+
+        # Per-ball params, read once instead of through nested lookups each ball
+        params = self.probability_model.params
+        extras = params.get("extras", {})
+        self.wide_chance = extras.get("wide_chance", 0.02)
+        self.noball_chance = extras.get("noball_chance", 0.01)
+        boundary_save = params.get("fielding", {}).get("boundary_save", {})
+        self.boundary_save_max_chance = boundary_save.get("max_chance", 0.30)
+
+        # Dismissal types and their cumulative probabilities, per bowler kind
+        dismissals = params.get("dismissals", {})
+        base_dismissals = dismissals.get("base", {})
+        self.spin_dismissals = self._build_dismissal_table(
+            dismissals.get("spin_bowler", base_dismissals)
+        )
+        self.pace_dismissals = self._build_dismissal_table(
+            dismissals.get("fast_bowler", base_dismissals)
+        )
+
+    @staticmethod
+    def _build_dismissal_table(
+        probs: Dict[str, float]
+    ) -> Tuple[Tuple[DismissalType, ...], Tuple[float, ...]]:
+        """Turn a dismissal distribution into (types, cumulative probabilities)."""
+        types = tuple(DismissalType(name) for name in probs)
+        return types, tuple(accumulate(probs.values()))
+
+    def _build_spell_phase_bonuses(self) -> Dict[MatchPhase, Tuple[float, float, float]]:
+        """
+        Precompute the bowler-selection bonus for each (phase, style kind).
+
+        Uses IPL-derived spell patterns:
+        - Pace: 49.5% PP, 27.4% middle, 23.1% death
+        - Spin: 22.8% PP, 65.9% middle, 11.3% death
+
+        Tuples are indexed by STYLE_KIND_OTHER/PACE/SPIN; other styles get no bonus.
+        """
+        spell_patterns = self.probability_model.params.get("spell_patterns", {})
+        pace_profile = spell_patterns.get("pace_profile", {
+            "powerplay": 0.495, "middle": 0.274, "death": 0.231
+        })
+        spin_profile = spell_patterns.get("spin_profile", {
+            "powerplay": 0.228, "middle": 0.659, "death": 0.113
+        })
+
+        # Bonus is proportional to how much this bowler type typically bowls
+        # in the phase, e.g. spin: 0.659 (middle) -> +33, 0.113 (death) -> +6
+        return {
+            phase: (
+                0.0,
+                pace_profile.get(phase.value, 0.33) * 50,
+                spin_profile.get(phase.value, 0.33) * 50,
+            )
+            for phase in MatchPhase
+        }
+
     def get_phase(self, overs: float) -> MatchPhase:
         """Determine match phase based on overs and format."""
+        if 0 <= overs < self.TOTAL_OVERS:
+            return self.phase_by_over[int(overs)]
+        return self._classify_phase(overs)
+
+    def _classify_phase(self, overs: float) -> MatchPhase:
+        """Look up the format's phase table for an overs value."""
         for phase_name, (start, end) in self.format_config.phases.items():
             if start <= overs < end:
-                # Map phase names to MatchPhase enum
-                phase_mapping = {
-                    "powerplay": MatchPhase.POWERPLAY,
-                    "middle": MatchPhase.MIDDLE,
-                    "death": MatchPhase.DEATH,
-                    "new_ball": MatchPhase.POWERPLAY,  # Map Test phases to existing enums
-                    "old_ball": MatchPhase.DEATH,
-                }
-                return phase_mapping.get(phase_name, MatchPhase.MIDDLE)
+                return PHASE_MAPPING.get(phase_name, MatchPhase.MIDDLE)
         return MatchPhase.MIDDLE
 
     def _calculate_recent_ball_stats(
@@ -96,16 +186,13 @@ class MatchEngine:
 
         for ball in recent_balls[-6:]:  # Last 6 balls
             outcome = ball.outcome
-            if isinstance(outcome, RunsOutcome):
-                recent_runs += outcome.runs
+            # Every outcome carries runs; only plain runs count as dots/boundaries
+            recent_runs += outcome.runs
+            if outcome.type == "runs":
                 if outcome.runs == 0:
                     recent_dots += 1
                 elif outcome.runs in (4, 6):
                     recent_boundaries += 1
-            elif isinstance(outcome, WicketOutcome):
-                recent_runs += outcome.runs
-            elif isinstance(outcome, ExtraOutcome):
-                recent_runs += outcome.runs
 
         return recent_runs, recent_boundaries, recent_dots
 
@@ -120,10 +207,14 @@ class MatchEngine:
         fielding_team: List[PlayerStats],
         target: Optional[int] = None,
         include_narrative: bool = True,
+        boundary_save_chance: Optional[float] = None,
     ) -> Tuple[BallOutcome, str, Dict[str, float]]:
         """
         Simulate a single ball delivery.
 
+        boundary_save_chance may be passed in when the fielding team's
+        chance has already been worked out, e.g. once per over.
+
         Returns:
             Tuple of (outcome, narrative, probabilities_used)
         """
@@ -131,21 +222,24 @@ class MatchEngine:
         phase = self.get_phase(overs)
 
         # Get batter's balls faced
-        batter_stats = innings_state.batter_stats.get(striker.id, BatterStats())
+        batter_stats = innings_state.batter_stats.get(striker.id) or EMPTY_BATTER_STATS
         balls_faced = batter_stats.balls
 
         # Calculate partnership runs
-        last_wicket = innings_state.fall_of_wickets[-1] if innings_state.fall_of_wickets else None
+        fall_of_wickets = innings_state.fall_of_wickets
+        last_wicket = fall_of_wickets[-1] if fall_of_wickets else None
         partnership_runs = innings_state.runs - (last_wicket.runs if last_wicket else 0)
 
-        # Count recent wickets (last 3 overs)
+        # Count recent wickets (last 3 overs). A linear count, since a
+        # client-supplied fall_of_wickets may be in any order, and it never
+        # holds more than ten entries.
         recent_wickets = sum(
-            1 for fow in innings_state.fall_of_wickets
+            1 for fow in fall_of_wickets
             if fow.overs >= overs - 3
         )
 
         # Get bowler's wickets this innings
-        bowler_stats = innings_state.bowler_stats.get(bowler.id, BowlerStats())
+        bowler_stats = innings_state.bowler_stats.get(bowler.id) or EMPTY_BOWLER_STATS
         bowler_wickets = bowler_stats.wickets
 
         # Calculate momentum metrics from recent balls
@@ -178,7 +272,9 @@ class MatchEngine:
         probs = self.probability_model.calculate_probabilities(ctx)
 
         # Roll for outcome
-        outcome = self._roll_outcome(probs, bowler, fielding_team)
+        if boundary_save_chance is None:
+            boundary_save_chance = self.get_boundary_save_chance(fielding_team)
+        outcome = self._roll_outcome(probs, bowler, boundary_save_chance)
 
         # Generate narrative
         narrative = ""
@@ -191,16 +287,15 @@ class MatchEngine:
         self,
         probs: Dict[str, float],
         bowler: PlayerStats,
-        fielding_team: List[PlayerStats],
+        boundary_save_chance: float,
     ) -> BallOutcome:
         """Roll for ball outcome based on probabilities."""
         rand = random.random()
         cumulative = 0.0
 
         # Check for extras first (small chance)
-        extra_chance = self.probability_model.params.get("extras", {})
-        wide_chance = extra_chance.get("wide_chance", 0.02)
-        noball_chance = extra_chance.get("noball_chance", 0.01)
+        wide_chance = self.wide_chance
+        noball_chance = self.noball_chance
 
         if rand < wide_chance:
             return ExtraOutcome(extra_type="wide", runs=1)
@@ -215,10 +310,10 @@ class MatchEngine:
         rand = rand / remaining if remaining > 0 else rand
 
         # Roll through outcomes
-        for outcome_type in ["dot", "single", "two", "three", "four", "six", "wicket"]:
+        for outcome_type in OUTCOME_ORDER:
             cumulative += probs.get(outcome_type, 0)
             if rand < cumulative:
-                return self._create_outcome(outcome_type, bowler, fielding_team)
+                return self._create_outcome(outcome_type, bowler, boundary_save_chance)
 
         # Default to dot
         return RunsOutcome(runs=0)
@@ -227,35 +322,35 @@ class MatchEngine:
         self,
         outcome_type: str,
         bowler: PlayerStats,
-        fielding_team: List[PlayerStats],
+        boundary_save_chance: float,
     ) -> BallOutcome:
         """Create the appropriate outcome object."""
-        if outcome_type == "dot":
-            return RunsOutcome(runs=0)
-        elif outcome_type == "single":
-            return RunsOutcome(runs=1)
-        elif outcome_type == "two":
-            return RunsOutcome(runs=2)
-        elif outcome_type == "three":
-            return RunsOutcome(runs=3)
-        elif outcome_type == "four":
+        runs = PLAIN_RUNS_OUTCOMES.get(outcome_type)
+        if runs is not None:
+            return RunsOutcome(runs=runs)
+
+        if outcome_type == "four":
             # Check for boundary save
-            if self._check_boundary_save(fielding_team):
+            if self._check_boundary_save(boundary_save_chance):
                 saved_runs = 2 if random.random() < 0.7 else 3
                 return RunsOutcome(runs=saved_runs, boundary_saved=True)
             return RunsOutcome(runs=4)
-        elif outcome_type == "six":
-            return RunsOutcome(runs=6)
-        elif outcome_type == "wicket":
+
+        if outcome_type == "wicket":
             dismissal = self._get_dismissal_type(bowler)
             return WicketOutcome(dismissal_type=dismissal, runs=0)
 
         return RunsOutcome(runs=0)
 
-    def _check_boundary_save(self, fielding_team: List[PlayerStats]) -> bool:
-        """Check if athletic fielding saves a boundary."""
+    def get_boundary_save_chance(self, fielding_team: List[PlayerStats]) -> float:
+        """
+        Get the chance that the fielding team saves a four.
+
+        Depends only on the fielding team, so it can be worked out once and
+        reused for every ball the team fields.
+        """
         if not fielding_team:
-            return False
+            return 0.0
 
         # Calculate average fielding
         total_athleticism = sum(p.fielding.athleticism for p in fielding_team)
@@ -266,34 +361,24 @@ class MatchEngine:
         avg_ground = total_ground / count
 
         # Save chance based on fielding params
-        fielding_config = self.probability_model.params.get("fielding", {})
-        max_chance = fielding_config.get("boundary_save", {}).get("max_chance", 0.30)
-
         save_chance = ((avg_athleticism - 50) / 200) + ((avg_ground - 50) / 400)
-        save_chance = min(max_chance, max(0, save_chance))
+        return min(self.boundary_save_max_chance, max(0, save_chance))
 
+    def _check_boundary_save(self, save_chance: float) -> bool:
+        """Check if athletic fielding saves a boundary."""
+        if save_chance <= 0:
+            return False
         return random.random() < save_chance
 
     def _get_dismissal_type(self, bowler: PlayerStats) -> DismissalType:
         """Get dismissal type based on bowler type."""
-        dismissals = self.probability_model.params.get("dismissals", {})
-
-        # Determine if pace or spin
-        is_spin = bowler.bowling_style and "spin" in bowler.bowling_style.value.lower()
-
-        if is_spin:
-            probs = dismissals.get("spin_bowler", dismissals.get("base", {}))
-        else:
-            probs = dismissals.get("fast_bowler", dismissals.get("base", {}))
+        types, cumulative = self.spin_dismissals if bowler.is_spin else self.pace_dismissals
 
-        # Roll for dismissal type
-        rand = random.random()
-        cumulative = 0.0
-
-        for dismissal_type, prob in probs.items():
-            cumulative += prob
-            if rand < cumulative:
-                return DismissalType(dismissal_type)
+        # Roll for dismissal type: the first type whose cumulative probability
+        # exceeds the roll
+        index = bisect_right(cumulative, random.random())
+        if index < len(types):
+            return types[index]
 
         return DismissalType.CAUGHT
 
@@ -307,21 +392,31 @@ class MatchEngine:
         bowling_tactics: BowlingTactics,
         pitch: PitchConditions,
         target: Optional[int] = None,
-    ) -> Tuple[OverSummary, InningsState, bool]:
+    ) -> Tuple[OverSummary, InningsState, bool, List[str]]:
         """
         Simulate a complete over.
 
         Returns:
-            Tuple of (over_summary, updated_innings_state, innings_complete)
+            Tuple of (over_summary, updated_innings_state, innings_complete,
+            narratives), with narratives collected ball by ball
         """
         over_number = innings_state.overs
         balls: List[BallEvent] = []
+        narratives: List[str] = []
         runs = 0
         wickets = 0
 
         current_batters = list(innings_state.current_batters)
         striker_idx = 0
 
+        # Look batters up by id (first player wins on a duplicate id, as with a
+        # scan), and take new batters from one lazy walk of the batting order
+        # that skips anyone who has already batted
+        batting_by_id = {p.id: p for p in reversed(batting_team)}
+        used_batters = set(current_batters)
+        used_batters.update(fow.player for fow in innings_state.fall_of_wickets)
+        next_batters = (p for p in batting_team if p.id not in used_batters)
+
         # Copy innings state for updates
         updated_state = InningsState(
             batting_team=innings_state.batting_team,
@@ -342,10 +437,13 @@ class MatchEngine:
         ball_number = 0
         innings_complete = False
 
+        # The fielding side is fixed for the over, so its save chance is too
+        boundary_save_chance = self.get_boundary_save_chance(bowling_team)
+
         while ball_number < self.BALLS_PER_OVER and not innings_complete:
             # Get striker
             striker_id = current_batters[striker_idx]
-            striker = next((p for p in batting_team if p.id == striker_id), None)
+            striker = batting_by_id.get(striker_id)
 
             if not striker:
                 innings_complete = True
@@ -361,6 +459,7 @@ class MatchEngine:
                 pitch=pitch,
                 fielding_team=bowling_team,
                 target=target,
+                boundary_save_chance=boundary_save_chance,
             )
 
             # Create ball event
@@ -373,11 +472,13 @@ class MatchEngine:
                 narrative=narrative,
             )
             balls.append(ball_event)
+            narratives.append(narrative)
 
-            # Process outcome
+            # Process outcome, dispatching on the union's discriminator tag
             is_legal = True
+            kind = outcome.type
 
-            if isinstance(outcome, WicketOutcome):
+            if kind == "wicket":
                 wickets += 1
                 runs += outcome.runs
                 updated_state.wickets += 1
@@ -391,26 +492,21 @@ class MatchEngine:
                 ))
 
                 # Get next batter
-                used_batters = set(current_batters) | {
-                    fow.player for fow in updated_state.fall_of_wickets
-                }
-                next_batter = next(
-                    (p for p in batting_team if p.id not in used_batters),
-                    None
-                )
+                next_batter = next(next_batters, None)
 
                 if next_batter and updated_state.wickets < self.MAX_WICKETS:
                     current_batters[striker_idx] = next_batter.id
+                    used_batters.add(next_batter.id)
                 else:
                     innings_complete = True
 
-            elif isinstance(outcome, ExtraOutcome):
+            elif kind == "extra":
                 runs += outcome.runs
                 updated_state.runs += outcome.runs
                 if outcome.extra_type in ("wide", "noball"):
                     is_legal = False
 
-            elif isinstance(outcome, RunsOutcome):
+            elif kind == "runs":
                 runs += outcome.runs
                 updated_state.runs += outcome.runs
 
@@ -435,15 +531,11 @@ class MatchEngine:
                 bowler_stats = updated_state.bowler_stats.get(
                     bowler.id, BowlerStats()
                 )
-                if isinstance(outcome, WicketOutcome):
+                bowler_stats.runs += outcome.runs
+                if kind == "wicket":
                     bowler_stats.wickets += 1
-                    bowler_stats.runs += outcome.runs
-                elif isinstance(outcome, RunsOutcome):
-                    bowler_stats.runs += outcome.runs
-                    if outcome.runs == 0:
-                        bowler_stats.dots += 1
-                elif isinstance(outcome, ExtraOutcome):
-                    bowler_stats.runs += outcome.runs
+                elif kind == "runs" and outcome.runs == 0:
+                    bowler_stats.dots += 1
                 updated_state.bowler_stats[bowler.id] = bowler_stats
 
             # Count legal deliveries
@@ -492,7 +584,7 @@ class MatchEngine:
         updated_state.over_summaries.append(over_summary)
         updated_state.recent_balls = balls[-6:]
 
-        return over_summary, updated_state, innings_complete
+        return over_summary, updated_state, innings_complete, narratives
 
     def get_batsman_state(self, balls_faced: int) -> str:
         """Get batsman state for context updates."""
@@ -535,3 +627,26 @@ class MatchEngine:
         if recent_runs >= 20:
             return "batting"
         return "neutral"
+
+
+# Cache engines per format
+_engines: Dict[str, MatchEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(format_name: str = "t20") -> MatchEngine:
+    """Get or create match engine instance for the specified format."""
+    format_key = format_name.lower()
+
+    engine = _engines.get(format_key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(format_key)
+            if engine is None:
+                engine = MatchEngine(
+                    probability_model=get_probability_model(format_key),
+                    format_config=get_format_config(format_key),
+                )
+                _engines[format_key] = engine
+
+    return engine
@@ -168,19 +168,7 @@ class ProbabilityModel:
 
     def _calculate_skill_differential(self, striker: PlayerStats, bowler: PlayerStats) -> float:
         """Calculate skill differential between batter and bowler (-1 to 1)."""
-        batting_skill = (
-            striker.batting.technique * 0.25 +
-            striker.batting.power * 0.25 +
-            striker.batting.timing * 0.30 +
-            striker.batting.temperament * 0.20
-        )
-        bowling_skill = (
-            bowler.bowling.speed * 0.20 +
-            bowler.bowling.accuracy * 0.35 +
-            bowler.bowling.variation * 0.25 +
-            bowler.bowling.stamina * 0.20
-        )
-        return (batting_skill - bowling_skill) / 100
+        return (striker.batting_skill - bowler.bowling_skill) / 100
 
     def _apply_skill_modifiers(self, probs: Dict[str, float], skill_diff: float) -> Dict[str, float]:
         """Apply skill differential to probabilities."""
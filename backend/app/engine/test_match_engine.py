@@ -404,7 +404,7 @@ class TestMatchEngine(MatchEngine):
             bowler = bowling_team[overs_bowled % len(bowling_team)]
 
             # Simulate over
-            over_summary, innings_state, innings_complete = self.simulate_over(
+            over_summary, innings_state, innings_complete, _ = self.simulate_over(
                 batting_team=batting_team,
                 bowling_team=bowling_team,
                 bowler=bowler,
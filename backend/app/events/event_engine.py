@@ -5,6 +5,7 @@ to generate meaningful events that fit the current game state.
 """
 
 import random
+import threading
 import uuid
 from typing import Dict, List, Optional, Tuple
 
@@ -301,11 +302,14 @@ class EventEngine:
 
 # Singleton instance
 _engine: Optional[EventEngine] = None
+_engine_lock = threading.Lock()
 
 
 def get_event_engine() -> EventEngine:
     """Get the singleton event engine instance."""
     global _engine
     if _engine is None:
-        _engine = EventEngine()
+        with _engine_lock:
+            if _engine is None:
+                _engine = EventEngine()
     return _engine
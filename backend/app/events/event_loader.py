@@ -4,6 +4,8 @@ Loads and validates event templates from YAML files, supporting
 hot-reload in development and caching in production.
 """
 
+import threading
+
 import yaml
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -78,6 +80,8 @@ class EventLoader:
             "board": [],
             "season": [],
         }
+        self._template_counts: Dict[str, int] = {}
+        self._template_total = 0
         self._loaded = False
 
     def load_all(self, force_reload: bool = False) -> None:
@@ -102,6 +106,12 @@ class EventLoader:
             if filepath.exists():
                 self._load_file(filepath)
 
+        # Templates only change on (re)load, so count them once here
+        self._template_counts = {
+            category: len(templates)
+            for category, templates in self._templates_by_category.items()
+        }
+        self._template_total = sum(self._template_counts.values())
         self._loaded = True
 
     def _load_file(self, filepath: Path) -> None:
@@ -174,23 +184,32 @@ class EventLoader:
         return list(self._templates.values())
 
     def get_template_count(self) -> Dict[str, int]:
-        """Get count of templates per category."""
+        """Get count of templates per category (cached; treat as read-only)."""
         if not self._loaded:
             self.load_all()
-        return {
-            category: len(templates)
-            for category, templates in self._templates_by_category.items()
-        }
+        return self._template_counts
+
+    def get_template_total(self) -> int:
+        """Get total number of loaded templates."""
+        if not self._loaded:
+            self.load_all()
+        return self._template_total
 
 
 # Singleton instance
 _loader: Optional[EventLoader] = None
+_loader_lock = threading.Lock()
 
 
 def get_event_loader() -> EventLoader:
     """Get the singleton event loader instance."""
     global _loader
     if _loader is None:
-        _loader = EventLoader()
-        _loader.load_all()
+        with _loader_lock:
+            if _loader is None:
+                # Publish only once fully loaded, so no other thread sees a
+                # loader that is still filling its template lists
+                loader = EventLoader()
+                loader.load_all()
+                _loader = loader
     return _loader
@@ -1,5 +1,8 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -7,15 +10,27 @@ from fastapi.exceptions import RequestValidationError
 
 from app.config import get_settings
 from app.api.v1.router import api_router
+from app.services.simulation_pool import shutdown_simulation_pool
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the sync-endpoint threadpool; release the simulation pool on shutdown."""
+    if settings.threadpool_size > 0:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    yield
+    shutdown_simulation_pool()
+
+
 app = FastAPI(
     title="Cricket Management API",
     description="Backend API for Cricket Management Game - Match simulation and event generation",
     version="0.1.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    lifespan=lifespan,
 )
 
 
@@ -104,6 +104,21 @@ class BowlingStyle(str, Enum):
     LEFT_ARM_SPIN = "left-arm-spin"
 
 
+# Bowling style kinds, usable as tuple indexes (medium pacers are "other")
+STYLE_KIND_OTHER = 0
+STYLE_KIND_PACE = 1
+STYLE_KIND_SPIN = 2
+
+BOWLING_STYLE_KIND: Dict[BowlingStyle, int] = {
+    style: (
+        STYLE_KIND_PACE if "fast" in style.value
+        else STYLE_KIND_SPIN if "spin" in style.value
+        else STYLE_KIND_OTHER
+    )
+    for style in BowlingStyle
+}
+
+
 class PlayingRole(str, Enum):
     OPENING_BATTER = "opening-batter"
     TOP_ORDER_BATTER = "top-order-batter"
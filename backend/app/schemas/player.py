@@ -9,6 +9,10 @@ from app.schemas.common import (
     BowlingStyle,
     PlayingRole,
     Temperament,
+    BOWLING_STYLE_KIND,
+    STYLE_KIND_OTHER,
+    STYLE_KIND_PACE,
+    STYLE_KIND_SPIN,
 )
 
 
@@ -74,6 +78,46 @@ class PlayerStats(BaseModel):
     class Config:
         populate_by_name = True
 
+    # Bowling-type flags come from a style lookup table instead of
+    # string-matching the style. Medium pacers are neither. Computed on access
+    # so they follow bowling_style through assignment and model_copy.
+    @property
+    def style_kind(self) -> int:
+        """Bowling style kind: STYLE_KIND_PACE, STYLE_KIND_SPIN or STYLE_KIND_OTHER."""
+        return BOWLING_STYLE_KIND.get(self.bowling_style, STYLE_KIND_OTHER)
+
+    @property
+    def is_pace(self) -> bool:
+        """True for fast bowlers (right/left-arm fast)."""
+        return self.style_kind == STYLE_KIND_PACE
+
+    @property
+    def is_spin(self) -> bool:
+        """True for spin bowlers (off, leg, left-arm spin)."""
+        return self.style_kind == STYLE_KIND_SPIN
+
+    # Weighted skill composites, shared by the probability model and bowler
+    # recommendations. Computed on access so they follow skill updates.
+    @property
+    def batting_skill(self) -> float:
+        """Overall batting skill (0-100)."""
+        return (
+            self.batting.technique * 0.25 +
+            self.batting.power * 0.25 +
+            self.batting.timing * 0.30 +
+            self.batting.temperament * 0.20
+        )
+
+    @property
+    def bowling_skill(self) -> float:
+        """Overall bowling skill (0-100)."""
+        return (
+            self.bowling.speed * 0.20 +
+            self.bowling.accuracy * 0.35 +
+            self.bowling.variation * 0.25 +
+            self.bowling.stamina * 0.20
+        )
+
 
 class BatterStats(BaseModel):
     """Individual batter stats for an innings."""
@@ -89,3 +133,10 @@ class BowlerStats(BaseModel):
     runs: int = 0
     wickets: int = 0
     dots: int = 0
+
+
+# Shared defaults for players with no innings stats yet. One instance is handed
+# to every request, so they are strictly read-only: code that updates stats
+# must create its own BatterStats()/BowlerStats() instead.
+EMPTY_BATTER_STATS = BatterStats()
+EMPTY_BOWLER_STATS = BowlerStats()
@@ -0,0 +1,83 @@
+"""Process pool for CPU-bound match simulation.
+
+Over simulation is pure Python and holds the GIL, so the Starlette
+threadpool alone cannot run concurrent simulations in parallel. When
+``simulation_workers`` is set, over simulation is handed to a pool of
+worker processes; otherwise it runs inline in the request thread.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.engine.match_engine import get_engine
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_simulation_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the shared process pool, or None if pooling is disabled."""
+    global _pool
+    workers = get_settings().simulation_workers
+    if workers <= 0:
+        return None
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # The pool is started lazily from a threadpool worker, and forking
+                # a threaded process can deadlock the child on locks held by other
+                # threads, so workers come from a forkserver instead. They start
+                # fresh, each with its own freshly seeded RNG.
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                )
+    return _pool
+
+
+def shutdown_simulation_pool() -> None:
+    """Shut down the process pool if one was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool, unless another thread has already replaced it."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _simulate_over_in_worker(format_name: str, kwargs: Dict[str, Any]) -> Tuple:
+    """Worker entry point: run an over on the worker's own cached engine."""
+    return get_engine(format_name).simulate_over(**kwargs)
+
+
+def run_simulate_over(format_name: str, **kwargs: Any) -> Tuple:
+    """
+    Simulate an over, in the process pool when enabled.
+
+    Takes the same keyword arguments as MatchEngine.simulate_over and
+    returns its (over_summary, updated_state, innings_complete, narratives)
+    tuple.
+    """
+    pool = get_simulation_pool()
+    if pool is None:
+        return _simulate_over_in_worker(format_name, kwargs)
+    try:
+        return pool.submit(_simulate_over_in_worker, format_name, kwargs).result()
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed) and the executor is unusable; drop
+        # it so the next call starts a fresh pool, and serve this over inline
+        _discard_broken_pool(pool)
+        return _simulate_over_in_worker(format_name, kwargs)
@@ -0,0 +1,343 @@
+"""Tests for the match simulation API helpers."""
+
+import multiprocessing
+import random
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.engine import match_engine
+from app.engine.match_engine import MatchEngine
+from app.main import app
+from app.services import simulation_pool
+from app.schemas.player import PlayerStats, BattingSkills, BowlingSkills, FieldingSkills
+from app.schemas.common import PlayerRole, BattingStyle, BowlingStyle, DismissalType
+from app.schemas.match import RunsOutcome, WicketOutcome
+
+
+def create_player(
+    player_id: str,
+    style: BowlingStyle,
+    accuracy: int = 70,
+    role: PlayerRole = PlayerRole.BOWLER,
+) -> dict:
+    """Create a player payload for API requests."""
+    return PlayerStats(
+        id=player_id,
+        name=f"Player {player_id}",
+        short_name=player_id,
+        role=role,
+        batting_style=BattingStyle.RIGHT,
+        bowling_style=style,
+        batting=BattingSkills(technique=30, power=30, timing=30, temperament=30),
+        bowling=BowlingSkills(speed=70, accuracy=accuracy, variation=60, stamina=70),
+        fielding=FieldingSkills(catching=50, ground=50, throwing=50, athleticism=50),
+        form=0,
+        fitness=90,
+        morale=70,
+        fatigue=10,
+    ).model_dump(mode="json")
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    # Use the full default params so the tests don't depend on per-format YAML
+    monkeypatch.setitem(match_engine._engines, "t20", MatchEngine())
+    return TestClient(app)
+
+
+def recommend_request(bowlers, overs: int, last_bowler_id=None, partnership_runs: int = 0) -> dict:
+    return {
+        "available_bowlers": bowlers,
+        "innings_state": {
+            "batting_team": "team-a",
+            "bowling_team": "team-b",
+            "overs": overs,
+            "current_batters": ["bat-1", "bat-2"],
+            "current_bowler": "",
+        },
+        "last_bowler_id": last_bowler_id,
+        "match_context": {"phase": "middle", "partnership_runs": partnership_runs},
+    }
+
+
+class TestRecommendBowler:
+    """Tests for the /match/bowler/recommend endpoint."""
+
+    def test_spin_preferred_in_middle_overs(self, client):
+        """Spell patterns favour spin in the middle overs."""
+        bowlers = [
+            create_player("pace-1", BowlingStyle.RIGHT_ARM_FAST),
+            create_player("spin-1", BowlingStyle.OFF_SPIN),
+        ]
+        response = client.post("/api/v1/match/bowler/recommend", json=recommend_request(bowlers, overs=10))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["recommended_bowler_id"] == "spin-1"
+        assert "Spin dominates middle overs" in data["reasoning"]
+        assert [a["bowler_id"] for a in data["alternatives"]] == ["pace-1"]
+
+    def test_at_most_three_alternatives(self, client):
+        """Only the top three alternatives are returned, best first."""
+        bowlers = [
+            create_player(f"pace-{i}", BowlingStyle.RIGHT_ARM_FAST, accuracy=50 + i * 5)
+            for i in range(6)
+        ]
+        response = client.post("/api/v1/match/bowler/recommend", json=recommend_request(bowlers, overs=2))
+
+        data = response.json()
+        assert data["recommended_bowler_id"] == "pace-5"
+        assert [a["bowler_id"] for a in data["alternatives"]] == ["pace-4", "pace-3", "pace-2"]
+        assert all(a["reasoning"] for a in data["alternatives"])
+
+    def test_last_bowler_excluded(self, client):
+        """The bowler who just bowled cannot bowl consecutive overs."""
+        bowlers = [
+            create_player("spin-1", BowlingStyle.OFF_SPIN),
+            create_player("pace-1", BowlingStyle.RIGHT_ARM_FAST),
+        ]
+        response = client.post(
+            "/api/v1/match/bowler/recommend",
+            json=recommend_request(bowlers, overs=10, last_bowler_id="spin-1"),
+        )
+
+        data = response.json()
+        assert data["recommended_bowler_id"] == "pace-1"
+        assert data["alternatives"] == []
+
+    def test_recent_wickets_counted_in_any_order(self, client):
+        """Recent wickets are counted even when fall_of_wickets is out of order."""
+        bowlers = [create_player("spin-1", BowlingStyle.OFF_SPIN)]
+        request = recommend_request(bowlers, overs=10)
+        request["innings_state"]["fall_of_wickets"] = [
+            {"player": "bat-3", "runs": 60, "overs": 9.2},
+            {"player": "bat-1", "runs": 5, "overs": 1.4},
+            {"player": "bat-4", "runs": 62, "overs": 8.1},
+        ]
+        response = client.post("/api/v1/match/bowler/recommend", json=request)
+
+        assert "Keep pressure after 2 recent wickets" in response.json()["reasoning"]
+
+
+def ball_request(include_narrative: bool) -> dict:
+    striker = create_player("bat-1", BowlingStyle.OFF_SPIN, role=PlayerRole.BATSMAN)
+    non_striker = create_player("bat-2", BowlingStyle.OFF_SPIN, role=PlayerRole.BATSMAN)
+    bowler = create_player("pace-1", BowlingStyle.RIGHT_ARM_FAST)
+    return {
+        "innings_state": {
+            "batting_team": "team-a",
+            "bowling_team": "team-b",
+            "runs": 40,
+            "overs": 5,
+            "balls": 2,
+            "current_batters": ["bat-1", "bat-2"],
+            "current_bowler": "pace-1",
+        },
+        "striker": striker,
+        "non_striker": non_striker,
+        "bowler": bowler,
+        "fielding_team": [bowler],
+        "batting_tactics": {"approach": "balanced"},
+        "bowling_tactics": {"length": "good-length", "field_setting": "balanced"},
+        "pitch_conditions": {"pace": 50, "spin": 50, "bounce": 50},
+        "match_phase": "powerplay",
+        "include_narrative": include_narrative,
+    }
+
+
+class TestSimulateBall:
+    """Tests for the /match/simulate/ball endpoint."""
+
+    def test_narrative_and_probabilities_included(self, client):
+        response = client.post("/api/v1/match/simulate/ball", json=ball_request(True))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["narrative"]
+        assert abs(sum(data["probabilities_used"].values()) - 1.0) < 0.0001
+
+    def test_fast_path_skips_narrative_and_probabilities(self, client):
+        response = client.post("/api/v1/match/simulate/ball", json=ball_request(False))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["narrative"] == ""
+        assert data["probabilities_used"] is None
+        assert data["updated_state"]["runs"] >= 40
+
+
+@pytest.fixture
+def fixed_outcome(client, monkeypatch):
+    """Make the engine's next simulated ball return the given outcome."""
+    engine = match_engine._engines["t20"]
+
+    def set_outcome(outcome):
+        monkeypatch.setattr(engine, "simulate_ball", lambda **kwargs: (outcome, "", {}))
+
+    return set_outcome
+
+
+def simulate_fixed_ball(client, fixed_outcome, outcome, **state) -> dict:
+    """Simulate one ball with a fixed outcome and return the updated state."""
+    fixed_outcome(outcome)
+    request = ball_request(False)
+    request["innings_state"].update(state)
+    response = client.post("/api/v1/match/simulate/ball", json=request)
+    assert response.status_code == 200
+    return response.json()["updated_state"]
+
+
+class TestSimulateBallState:
+    """Deterministic state updates for /match/simulate/ball."""
+
+    def test_odd_runs_swap_strike(self, client, fixed_outcome):
+        state = simulate_fixed_ball(client, fixed_outcome, RunsOutcome(runs=1), balls=2)
+
+        assert state["current_batters"] == ["bat-2", "bat-1"]
+        assert state["striker_changed"] is True
+        assert (state["runs"], state["overs"], state["balls"]) == (41, 5, 3)
+        assert state["innings_complete"] is False
+
+    def test_even_runs_keep_strike(self, client, fixed_outcome):
+        state = simulate_fixed_ball(client, fixed_outcome, RunsOutcome(runs=4), balls=2)
+
+        assert state["current_batters"] == ["bat-1", "bat-2"]
+        assert state["striker_changed"] is False
+        assert (state["runs"], state["balls"]) == (44, 3)
+
+    def test_last_ball_of_over_swaps_strike_and_completes_over(self, client, fixed_outcome):
+        state = simulate_fixed_ball(client, fixed_outcome, RunsOutcome(runs=0), balls=5)
+
+        assert state["current_batters"] == ["bat-2", "bat-1"]
+        assert state["striker_changed"] is True
+        assert (state["overs"], state["balls"]) == (6, 0)
+        assert state["innings_complete"] is False
+
+    def test_odd_runs_off_last_ball_keep_strike(self, client, fixed_outcome):
+        state = simulate_fixed_ball(client, fixed_outcome, RunsOutcome(runs=1), balls=5)
+
+        assert state["current_batters"] == ["bat-1", "bat-2"]
+        assert state["striker_changed"] is False
+        assert (state["overs"], state["balls"]) == (6, 0)
+
+    def test_wicket_needs_new_batsman(self, client, fixed_outcome):
+        outcome = WicketOutcome(dismissal_type=DismissalType.BOWLED)
+        state = simulate_fixed_ball(client, fixed_outcome, outcome, balls=2, wickets=3)
+
+        assert state["wickets"] == 4
+        assert state["new_batsman_needed"] is True
+        assert state["innings_complete"] is False
+
+    def test_tenth_wicket_completes_innings(self, client, fixed_outcome):
+        outcome = WicketOutcome(dismissal_type=DismissalType.BOWLED)
+        state = simulate_fixed_ball(client, fixed_outcome, outcome, balls=2, wickets=9)
+
+        assert state["wickets"] == 10
+        assert state["new_batsman_needed"] is False
+        assert state["innings_complete"] is True
+
+    def test_final_over_completes_innings(self, client, fixed_outcome):
+        state = simulate_fixed_ball(client, fixed_outcome, RunsOutcome(runs=0), overs=19, balls=5)
+
+        assert (state["overs"], state["balls"]) == (20, 0)
+        assert state["innings_complete"] is True
+
+
+def over_request() -> dict:
+    batters = [
+        create_player(f"bat-{i}", BowlingStyle.OFF_SPIN, role=PlayerRole.BATSMAN)
+        for i in range(1, 12)
+    ]
+    bowlers = [create_player(f"bowl-{i}", BowlingStyle.RIGHT_ARM_FAST) for i in range(1, 12)]
+    return {
+        "innings_state": {
+            "batting_team": "team-a",
+            "bowling_team": "team-b",
+            "overs": 3,
+            "current_batters": ["bat-1", "bat-2"],
+            "current_bowler": "bowl-2",
+        },
+        "batting_team": batters,
+        "bowling_team": bowlers,
+        "bowler_id": "bowl-1",
+        "batting_tactics": {"approach": "balanced"},
+        "bowling_tactics": {"length": "good-length", "field_setting": "balanced"},
+        "pitch_conditions": {"pace": 50, "spin": 50, "bounce": 50},
+    }
+
+
+def seed_pool_worker(seed: int) -> None:
+    """Pool initializer: build the worker's engine, then seed its RNG."""
+    # Building first keeps any import-time RNG use from shifting the sequence
+    match_engine.get_engine("t20")
+    random.seed(seed)
+
+
+@pytest.fixture
+def pooled_settings(monkeypatch, tmp_path):
+    """Enable the simulation pool with one worker, restoring settings afterwards."""
+    # Pool workers start fresh and build their own engines, so point them at
+    # a config dir holding only the full default params
+    params_path = tmp_path / "probability_params.yaml"
+    shutil.copy(get_settings().probability_params_path, params_path)
+    monkeypatch.setenv("PROBABILITY_PARAMS_PATH", str(params_path))
+    monkeypatch.setenv("SIMULATION_WORKERS", "1")
+    get_settings.cache_clear()
+    yield get_settings()
+    simulation_pool.shutdown_simulation_pool()
+    get_settings.cache_clear()
+
+
+class TestSimulateOverPool:
+    """Tests for running /match/simulate/over through the process pool."""
+
+    def test_pooled_over_matches_inline_response(self, client, request):
+        # Seed this process and the worker alike so both simulate the same over
+        random.seed(7)
+        inline = client.post("/api/v1/match/simulate/over", json=over_request())
+        assert inline.status_code == 200
+
+        request.getfixturevalue("pooled_settings")
+        simulation_pool._pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=seed_pool_worker,
+            initargs=(7,),
+        )
+        with TestClient(app) as pooled_client:
+            response = pooled_client.post("/api/v1/match/simulate/over", json=over_request())
+
+        assert response.status_code == 200
+        data, expected = response.json(), inline.json()
+        state, expected_state = data["updated_innings_state"], expected["updated_innings_state"]
+        assert (state["runs"], state["wickets"], state["overs"]) == (
+            expected_state["runs"], expected_state["wickets"], expected_state["overs"]
+        )
+        assert data == expected
+
+    def test_broken_pool_falls_back_inline_and_is_replaced(self, client, pooled_settings):
+        class DeadPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, *args, **kwargs):
+                pass
+
+        simulation_pool._pool = DeadPool()
+        response = client.post("/api/v1/match/simulate/over", json=over_request())
+
+        assert response.status_code == 200
+        assert response.json()["updated_innings_state"]["overs"] == 4
+        assert simulation_pool._pool is None
+
+    def test_lifespan_shuts_pool_down(self, pooled_settings):
+        with TestClient(app) as pooled_client:
+            pooled_client.post("/api/v1/match/simulate/over", json=over_request())
+            assert simulation_pool._pool is not None
+
+        assert simulation_pool._pool is None